@@ -1,13 +1,16 @@
 import asyncio
 import functools
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from math import floor
-from typing import TypedDict, overload
+import inspect
+import threading
+import time
+from collections.abc import Awaitable, Callable, Coroutine, Hashable
+from dataclasses import dataclass, field, replace
+from datetime import timedelta
+from math import inf
+from typing import Any, Never, TypedDict, cast, overload
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PollingOptions:
     interval: int
     """Interval between polling attempts in milliseconds"""
@@ -15,15 +18,25 @@ class PollingOptions:
     """Maximum time to poll before timing out in milliseconds"""
     backoff_factor: int = 1
     retry_limit: int = 1
+    max_interval: int | None = None
+    """Upper bound for the backed-off interval in milliseconds"""
+    wake_event: asyncio.Event | None = None
+    """Optional event that wakes `poll` before the interval elapses.
+
+    A producer can set this event when new work is available so the poller
+    retries immediately instead of sleeping out the rest of the interval.
+    The event is cleared after each wake-up."""
 
 
+# Not slotted: on Python 3.12, `PollSuccess[int](...)` on a frozen, slotted
+# generic dataclass raises TypeError when typing sets `__orig_class__`.
 @dataclass(frozen=True)
 class PollSuccess[T]:
     result: T | None = None
     attempts: int = field(kw_only=True)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PollFailure:
     error: Exception | None = None
     attempts: int = field(kw_only=True)
@@ -31,6 +44,9 @@ class PollFailure:
 
 type PollingResult[T] = PollSuccess[T] | PollFailure
 
+# Shared result for polls that end before the first attempt
+_EMPTY_SUCCESS: PollSuccess[Never] = PollSuccess(attempts=0)
+
 
 async def poll[R](
     fn: Callable[[], Awaitable[R]],
@@ -41,6 +57,11 @@ async def poll[R](
     Polls an asynchronous function at regular intervals until it returns
     a result or a timeout is reached.
 
+    The timeout is enforced by the event loop: an attempt that is still
+    running when it is reached gets cancelled and is not counted. If no
+    attempt finished in time, the result is a `PollFailure` carrying the
+    `TimeoutError`.
+
     Args:
         fn (Callable[[], R]): The asynchronous function to be polled.
         options (PollingOptions): The polling options.
@@ -73,62 +94,159 @@ async def poll[R](
         Success: 42 after 1 attempts
     """
 
-    retry_on_error = stop_condition is None
-    attempts = 0
-    current_interval = options.interval / 1000
-    last_result: R | None = None
-    last_error: Exception | None = None
-    start_time = asyncio.get_event_loop().time()
+    # No time budget: return before touching the loop or arming a timer
+    if options.timeout <= 0:
+        return _EMPTY_SUCCESS
 
-    timeout = options.timeout / 1000
+    deadline = asyncio.get_running_loop().time() + options.timeout / 1000
 
-    while attempts < options.retry_limit:
-        if asyncio.get_event_loop().time() - start_time >= timeout:
-            if last_error and retry_on_error:
-                return PollFailure(error=last_error, attempts=attempts)
-            return PollSuccess(result=last_result, attempts=attempts)
+    schedule = _backoff_schedule(options)
 
-        attempts += 1
+    # Dispatch once so each loop only carries the exits it needs
+    if stop_condition is None:
+        return await _poll_until_success(fn, options, schedule, deadline)
+    return await _poll_until_stop(fn, stop_condition, options, schedule, deadline)
 
-        try:
-            last_result = result = await fn()
-            last_error = None
 
-            if stop_condition:
-                if stop_condition(result):
-                    return PollSuccess(result=result, attempts=attempts)
-            else:
-                return PollSuccess(result=result, attempts=attempts)
-        except Exception as e:
-            last_error = e
-            if not retry_on_error:
-                return PollFailure(error=e, attempts=attempts)
+async def _poll_until_success[R](
+    fn: Callable[[], Awaitable[R]],
+    options: PollingOptions,
+    schedule: tuple[float, ...],
+    deadline: float,
+) -> PollingResult[R]:
+    """Polls `fn` until it returns without raising, retrying on errors."""
+    attempts = 0
+    last_delay = len(schedule) - 1
+    last_error: Exception | None = None
 
-        if asyncio.get_event_loop().time() - start_time >= timeout:
-            if last_error and retry_on_error:
-                return PollFailure(error=last_error, attempts=attempts)
-            return PollSuccess(result=last_result, attempts=attempts)
+    try:
+        async with asyncio.timeout_at(deadline):
+            while attempts < options.retry_limit:
+                # Count attempts once they finish, so a cancelled one is not
+                try:
+                    result = await fn()
+                except Exception as e:
+                    last_error = e
+                    attempts += 1
+                else:
+                    return PollSuccess(result=result, attempts=attempts + 1)
+
+                if attempts < options.retry_limit:
+                    await _wait_for_next_attempt(
+                        schedule[min(attempts - 1, last_delay)], options.wake_event
+                    )
+    except TimeoutError as e:
+        if attempts == 0:
+            return PollFailure(error=e, attempts=0)
+
+    if last_error is None:
+        return _EMPTY_SUCCESS
+    return PollFailure(error=last_error, attempts=attempts)
+
+
+async def _poll_until_stop[R](
+    fn: Callable[[], Awaitable[R]],
+    stop_condition: Callable[[R], bool],
+    options: PollingOptions,
+    schedule: tuple[float, ...],
+    deadline: float,
+) -> PollingResult[R]:
+    """Polls `fn` until `stop_condition` holds, failing on the first error."""
+    attempts = 0
+    last_delay = len(schedule) - 1
+    last_result: R | None = None
 
-        if attempts < options.retry_limit:
-            await asyncio.sleep(current_interval)
-            current_interval = floor(current_interval * options.backoff_factor)
+    try:
+        async with asyncio.timeout_at(deadline):
+            while attempts < options.retry_limit:
+                # Count attempts once they finish, so a cancelled one is not
+                try:
+                    last_result = result = await fn()
+                except Exception as e:
+                    return PollFailure(error=e, attempts=attempts + 1)
+                attempts += 1
+
+                try:
+                    if stop_condition(result):
+                        return PollSuccess(result=result, attempts=attempts)
+                except Exception as e:
+                    return PollFailure(error=e, attempts=attempts)
+
+                if attempts < options.retry_limit:
+                    await _wait_for_next_attempt(
+                        schedule[min(attempts - 1, last_delay)], options.wake_event
+                    )
+    except TimeoutError as e:
+        if attempts == 0:
+            return PollFailure(error=e, attempts=0)
 
-    if last_error and retry_on_error:
-        return PollFailure(error=last_error, attempts=attempts)
     return PollSuccess(result=last_result, attempts=attempts)
 
 
+def _backoff_schedule(options: PollingOptions) -> tuple[float, ...]:
+    """
+    Precomputes the delays in seconds between consecutive polling attempts.
+
+    The schedule ends once the delay stops changing (e.g. after reaching
+    `max_interval`); its last delay then applies to all remaining attempts.
+    """
+    interval = options.interval / 1000
+    max_interval = (
+        inf if options.max_interval is None else options.max_interval / 1000
+    )
+    schedule = [min(interval, max_interval)]
+
+    while len(schedule) < options.retry_limit - 1:
+        interval = min(schedule[-1] * options.backoff_factor, max_interval)
+        if interval == schedule[-1]:
+            break
+        schedule.append(interval)
+
+    return tuple(schedule)
+
+
+async def _wait_for_next_attempt(
+    interval: float, wake_event: asyncio.Event | None
+) -> None:
+    """Sleeps for `interval` seconds, returning early if `wake_event` is set."""
+    if interval <= 0:
+        await asyncio.sleep(0)
+    elif wake_event is None:
+        await asyncio.sleep(interval)
+    else:
+        try:
+            await asyncio.wait_for(wake_event.wait(), timeout=interval)
+            wake_event.clear()
+        except TimeoutError:
+            pass
+
+
+@overload
+def poll_sync[R](  # type: ignore[overload-overlap]
+    fn: Callable[[], Coroutine[Any, Any, R]],
+    options: PollingOptions,
+    stop_condition: Callable[[R], bool] | None = None,
+) -> PollingResult[R]: ...
+@overload
 def poll_sync[R](
     fn: Callable[[], R],
     options: PollingOptions,
     stop_condition: Callable[[R], bool] | None = None,
+) -> PollingResult[R]: ...
+
+
+def poll_sync[R](
+    fn: Callable[[], R] | Callable[[], Coroutine[Any, Any, R]],
+    options: PollingOptions,
+    stop_condition: Callable[[R], bool] | None = None,
 ) -> PollingResult[R]:
     """
     Polls a synchronous function at regular intervals until it returns
     a result or a timeout is reached.
 
     Args:
-        fn (Callable[[], R]): The synchronous function to be polled.
+        fn (Callable[[], R]): The synchronous function to be polled. A
+            coroutine function is polled with `poll` instead.
         options (PollingOptions): The polling options.
         stop_condition (Callable[[R], bool] | None): An optional function
             that determines when to stop polling based on the result. If
@@ -136,12 +254,70 @@ def poll_sync[R](
             limit exceeded. (default: None)
     Returns:
         PollingResult[R]: The result returned by the function, wrapped in polling result.
+
+    Note:
+        `poll_sync` ignores `options.wake_event` and always sleeps for the
+        full interval. Coroutine functions are polled with `poll` on a new
+        event loop, which is not possible from within a running event loop.
     """
 
-    async def wrapped_fn() -> R:
-        return fn()
+    if inspect.iscoroutinefunction(fn):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # The event would bind to this throwaway loop and fail on reuse
+            options = replace(options, wake_event=None)
+            return asyncio.run(poll(fn, options, stop_condition))
+        raise RuntimeError(
+            "poll_sync() cannot poll a coroutine function from a running "
+            "event loop; await poll() instead"
+        )
+
+    if options.timeout <= 0:
+        return _EMPTY_SUCCESS
+
+    # iscoroutinefunction only narrows the positive branch
+    sync_fn = cast(Callable[[], R], fn)
+    retry_on_error = stop_condition is None
+    attempts = 0
+    last_result: R | None = None
+    last_error: Exception | None = None
+    now = time.perf_counter
+    deadline = now() + options.timeout / 1000
+
+    schedule = _backoff_schedule(options)
+    last_delay = len(schedule) - 1
 
-    return asyncio.run(poll(wrapped_fn, options, stop_condition))
+    while attempts < options.retry_limit:
+        attempts += 1
+
+        try:
+            last_result = result = sync_fn()
+            last_error = None
+
+            if stop_condition:
+                if stop_condition(result):
+                    return PollSuccess(result=result, attempts=attempts)
+            else:
+                return PollSuccess(result=result, attempts=attempts)
+        except Exception as e:
+            last_error = e
+            if not retry_on_error:
+                return PollFailure(error=e, attempts=attempts)
+
+        if attempts >= options.retry_limit:
+            break
+
+        # Stop if the next attempt could only start after the deadline
+        delay = schedule[min(attempts - 1, last_delay)]
+        if delay >= deadline - now():
+            break
+        if delay > 0:
+            time.sleep(delay)
+
+    if last_error and retry_on_error:
+        return PollFailure(error=last_error, attempts=attempts)
+    return PollSuccess(result=last_result, attempts=attempts)
 
 
 type Decorator[**P, R] = Callable[[Callable[P, R]], Callable[P, R]]
@@ -149,16 +325,27 @@ type Decorator[**P, R] = Callable[[Callable[P, R]], Callable[P, R]]
 
 class Cache[T](TypedDict):
     value: T
-    expiry: datetime | None
+    expiry: float
+    """Monotonic deadline (see `time.monotonic`) after which the value is stale"""
 
 
 @overload
 def memomize_with_ttl[**P, R](
-    fn: Callable[P, R], /, *, ttl: timedelta | None
+    fn: Callable[P, R],
+    /,
+    *,
+    ttl: timedelta | None,
+    maxsize: int | None = None,
+    refresh_on_hit: bool = False,
 ) -> Callable[P, R]: ...
 @overload
 def memomize_with_ttl[**P, R](
-    fn: None = None, /, *, ttl: timedelta | None
+    fn: None = None,
+    /,
+    *,
+    ttl: timedelta | None,
+    maxsize: int | None = None,
+    refresh_on_hit: bool = False,
 ) -> Decorator[P, R]: ...
 
 
@@ -167,19 +354,43 @@ def memomize_with_ttl[**P, R](
     /,
     *,
     ttl: timedelta | None = None,
+    maxsize: int | None = None,
+    refresh_on_hit: bool = False,
 ) -> Decorator[P, R] | Callable[P, R]:
     """
     Memoization decorator with optional time-to-live (TTL).
 
+    Results are cached per set of arguments, so arguments must be hashable.
+
     Args:
         fn (Callable[P, R] | None): The function to be memoized.
         ttl (timedelta | None): The time-to-live for the cached value.
-            If None, the value is cached indefinitely.
+            If None, the value is cached indefinitely and the function is
+            wrapped with `functools.lru_cache`.
+        maxsize (int | None): The maximum number of cached results. Once
+            reached, the oldest (least recently used if `ttl` is None or
+            `refresh_on_hit` is set) entry is evicted to make room for a new
+            one. If None, the cache is unbounded; if zero or negative,
+            nothing is cached, as with `functools.lru_cache`. Expired entries
+            are dropped from the oldest end of the cache whenever a new
+            result is stored. (default: None)
+        refresh_on_hit (bool): Whether each cache hit pushes the entry's
+            expiry `ttl` into the future, keeping frequently used values
+            cached for as long as they keep being hit. Has no effect if `ttl`
+            is None. (default: False)
 
     Returns:
         Decorator[P, R] | Callable[P, R]: The memoized function or a
             decorator that can be applied to a function.
 
+    Note:
+        With a TTL, cache misses are serialised per set of arguments, so
+        concurrent callers trigger a single call to `fn` per miss while cache
+        hits stay lock-free unless `refresh_on_hit` is set. Misses for
+        different arguments, including recursive calls, do not wait on each
+        other. Without a TTL, `functools.lru_cache` may call `fn` more than
+        once for concurrent misses.
+
     Example:
         >>> @memomize_with_ttl(ttl=timedelta(seconds=60))
         ... def expensive_function(x: int) -> int:
@@ -204,19 +415,66 @@ def memomize_with_ttl[**P, R](
         ...    ttl=timedelta(minutes=5)
         ... )
     """
-    cache: Cache[R] | None = None
 
     def wrapper(fn: Callable[P, R]) -> Callable[P, R]:
+        if ttl is None:
+            # Nothing ever expires, so the C-level lru_cache does the job
+            return functools.lru_cache(maxsize=maxsize)(fn)
+
+        if maxsize is not None and maxsize <= 0:
+            return fn
+
+        ttl_seconds = ttl.total_seconds()
+        cache: dict[Hashable, Cache[R]] = {}
+        # Per-key locks with their number of users; `lock` guards this and
+        # writes to `cache`, and is never held while `fn` runs
+        key_locks: dict[Hashable, tuple[threading.RLock, int]] = {}
+        lock = threading.Lock()
+
         @functools.wraps(fn)
         def func(*args: P.args, **kwargs: P.kwargs) -> R:
-            nonlocal cache
-            now = datetime.now()
-            if cache and (cache["expiry"] is None or now < cache["expiry"]):
-                return cache["value"]
-            result = fn(*args, **kwargs)
-            expiry = None if ttl is None else now + ttl
-            cache = {"value": result, "expiry": expiry}
-            return result
+            key = functools._make_key(args, kwargs, typed=False)
+            now = time.monotonic()
+            entry = cache.get(key)
+            if entry and now < entry["expiry"]:
+                if refresh_on_hit:
+                    with lock:
+                        # Move to the back to keep the cache oldest first
+                        if cache.get(key) is entry:
+                            cache[key] = cache.pop(key)
+                            entry["expiry"] = now + ttl_seconds
+                return entry["value"]
+
+            with lock:
+                key_lock, users = key_locks.get(key) or (threading.RLock(), 0)
+                key_locks[key] = (key_lock, users + 1)
+            try:
+                with key_lock:
+                    # Another thread may have filled the entry while we waited
+                    entry = cache.get(key)
+                    if entry and now < entry["expiry"]:
+                        return entry["value"]
+                    result = fn(*args, **kwargs)
+                    with lock:
+                        # Re-insert so a refreshed entry counts as the newest
+                        cache.pop(key, None)
+                        # Stored oldest first, so expired entries sit up front
+                        while cache:
+                            oldest = next(iter(cache))
+                            if now < cache[oldest]["expiry"]:
+                                break
+                            del cache[oldest]
+                        if maxsize is not None and len(cache) >= maxsize:
+                            del cache[next(iter(cache))]
+                        cache[key] = {"value": result, "expiry": now + ttl_seconds}
+                    return result
+            finally:
+                with lock:
+                    key_lock, users = key_locks[key]
+                    if users == 1:
+                        del key_locks[key]
+                    else:
+                        key_locks[key] = (key_lock, users - 1)
 
         return func
 